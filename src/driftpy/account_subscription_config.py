@@ -7,6 +7,7 @@ from driftpy.accounts.bulk_account_loader import BulkAccountLoader
 from driftpy.accounts.cache import (
     CachedDriftClientAccountSubscriber,
     CachedUserAccountSubscriber,
+    OracleCache,
 )
 from driftpy.accounts.polling import (
     PollingDriftClientAccountSubscriber,
@@ -35,6 +36,9 @@ class AccountSubscriptionConfig:
         type: Literal["polling", "websocket", "cached", "demo"],
         bulk_account_loader: Optional[BulkAccountLoader] = None,
         commitment: Commitment = None,
+        cache_ttl_ms: Optional[int] = None,
+        max_concurrency: int = 8,
+        oracle_cache: Optional[OracleCache] = None,
     ):
         self.type = type
 
@@ -50,6 +54,9 @@ class AccountSubscriptionConfig:
             self.bulk_account_loader = bulk_account_loader
 
         self.commitment = commitment
+        self.cache_ttl_ms = cache_ttl_ms
+        self.max_concurrency = max_concurrency
+        self.oracle_cache = oracle_cache
 
     def get_drift_client_subscriber(
         self,
@@ -85,6 +92,7 @@ class AccountSubscriptionConfig:
                     oracle_infos,
                     should_find_all_markets_and_oracles,
                     self.commitment,
+                    self.max_concurrency,
                 )
             case "cached":
                 return CachedDriftClientAccountSubscriber(
@@ -94,6 +102,9 @@ class AccountSubscriptionConfig:
                     oracle_infos,
                     should_find_all_markets_and_oracles,
                     self.commitment,
+                    self.cache_ttl_ms,
+                    max_concurrency=self.max_concurrency,
+                    oracle_cache=self.oracle_cache,
                 )
             case "demo":
                 if (
@@ -124,7 +135,7 @@ class AccountSubscriptionConfig:
                 )
             case "cached":
                 return CachedUserAccountSubscriber(
-                    user_pubkey, program, self.commitment
+                    user_pubkey, program, self.commitment, self.cache_ttl_ms
                 )
             case "demo":
                 return DemoUserAccountSubscriber(user_pubkey, program, self.commitment)
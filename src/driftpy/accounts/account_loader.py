@@ -0,0 +1,87 @@
+import asyncio
+from typing import Optional
+
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment
+from solders.pubkey import Pubkey
+
+from driftpy.accounts.bulk_account_loader import GET_MULTIPLE_ACCOUNTS_CHUNK_SIZE
+from driftpy.accounts.types import BufferAndSlot
+
+
+class AccountLoader:
+    def __init__(
+        self,
+        connection: AsyncClient,
+        commitment: Commitment = "confirmed",
+        max_concurrency: int = 8,
+    ):
+        self.connection = connection
+        self.commitment = commitment
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.pending: dict[str, tuple[Pubkey, list[asyncio.Future]]] = {}
+        self.flush_scheduled = False
+        self.load_tasks: set[asyncio.Task] = set()
+
+    async def load(self, pubkey: Pubkey) -> Optional[BufferAndSlot]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        pubkey_str = str(pubkey)
+        if pubkey_str in self.pending:
+            self.pending[pubkey_str][1].append(future)
+        else:
+            self.pending[pubkey_str] = (pubkey, [future])
+
+        if not self.flush_scheduled:
+            self.flush_scheduled = True
+            loop.call_soon(self._flush)
+
+        return await future
+
+    def _flush(self):
+        pending = self.pending
+        self.pending = {}
+        self.flush_scheduled = False
+        # keep a reference so the task isn't garbage collected mid-load
+        load_task = asyncio.create_task(self._load(pending))
+        self.load_tasks.add(load_task)
+        load_task.add_done_callback(self.load_tasks.discard)
+
+    async def _load(self, pending: dict[str, tuple[Pubkey, list[asyncio.Future]]]):
+        pubkey_strs = list(pending.keys())
+        chunks = [
+            pubkey_strs[i : i + GET_MULTIPLE_ACCOUNTS_CHUNK_SIZE]
+            for i in range(0, len(pubkey_strs), GET_MULTIPLE_ACCOUNTS_CHUNK_SIZE)
+        ]
+
+        try:
+            await asyncio.gather(
+                *[self._load_chunk(chunk, pending) for chunk in chunks]
+            )
+        except Exception as e:
+            for _, futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+
+    async def _load_chunk(
+        self,
+        chunk: list[str],
+        pending: dict[str, tuple[Pubkey, list[asyncio.Future]]],
+    ):
+        async with self.semaphore:
+            resp = await self.connection.get_multiple_accounts(
+                [pending[pubkey_str][0] for pubkey_str in chunk],
+                commitment=self.commitment,
+                encoding="base64",
+            )
+        slot = resp.context.slot
+
+        for pubkey_str, account in zip(chunk, resp.value):
+            buffer_and_slot = (
+                BufferAndSlot(slot, account.data) if account is not None else None
+            )
+            for future in pending[pubkey_str][1]:
+                if not future.done():
+                    future.set_result(buffer_and_slot)
@@ -30,10 +30,12 @@ class BulkAccountLoader:
         connection: AsyncClient,
         commitment: Commitment = "confirmed",
         frequency: float = 1,
+        max_concurrency: int = 8,
     ):
         self.connection = connection
         self.commitment = commitment
         self.frequency = frequency
+        self.semaphore = asyncio.Semaphore(max_concurrency)
         self.task = None
         self.load_task = None
         self.callback_id = 0
@@ -124,12 +126,13 @@ class BulkAccountLoader:
             rpc_requests.append(rpc_request)
 
         try:
-            post = self.connection._provider.session.post(
-                self.connection._provider.endpoint_uri,
-                json=rpc_requests,
-                headers={"content-encoding": "gzip"},
-            )
-            resp = await asyncio.wait_for(post, timeout=10)
+            async with self.semaphore:
+                post = self.connection._provider.session.post(
+                    self.connection._provider.endpoint_uri,
+                    json=rpc_requests,
+                    headers={"content-encoding": "gzip"},
+                )
+                resp = await asyncio.wait_for(post, timeout=10)
         except asyncio.TimeoutError:
             print("request to rpc timed out")
             return
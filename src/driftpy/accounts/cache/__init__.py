@@ -1,2 +1,3 @@
 from .drift_client import *
 from .user import *
+from .oracle import *
@@ -1,3 +1,6 @@
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Optional
 
 from anchorpy import Program
@@ -6,25 +9,45 @@ from solders.pubkey import Pubkey  # type: ignore
 
 from solana.rpc.commitment import Commitment, Confirmed
 
-from driftpy.accounts.oracle import get_oracle_price_data_and_slot
-from driftpy.accounts.types import DriftClientAccountSubscriber, DataAndSlot
-from driftpy.accounts import (
-    get_state_account_and_slot,
-    get_spot_market_account_and_slot,
-    get_perp_market_account_and_slot,
+from driftpy.accounts.account_loader import AccountLoader
+from driftpy.accounts.cache.oracle import OracleCache
+from driftpy.accounts.cache.refresh import RefreshableCache
+from driftpy.accounts.oracle import decode_oracle
+from driftpy.accounts.types import (
+    BufferAndSlot,
+    DriftClientAccountSubscriber,
+    DataAndSlot,
 )
-from driftpy.constants.numeric_constants import QUOTE_SPOT_MARKET_INDEX
+from driftpy.addresses import (
+    get_perp_market_public_key,
+    get_spot_market_public_key,
+    get_state_public_key,
+)
+from driftpy.constants.numeric_constants import PRICE_PRECISION, QUOTE_SPOT_MARKET_INDEX
 from driftpy.types import (
     OracleInfo,
     PerpMarketAccount,
     SpotMarketAccount,
     OraclePriceData,
     StateAccount,
+    is_variant,
     stack_trace,
 )
 
 
-class CachedDriftClientAccountSubscriber(DriftClientAccountSubscriber):
+@dataclass(slots=True)
+class DriftClientCache:
+    state: DataAndSlot[StateAccount]
+    spot_markets: tuple[DataAndSlot[SpotMarketAccount], ...]
+    perp_markets: tuple[DataAndSlot[PerpMarketAccount], ...]
+    oracle_price_data: dict[str, DataAndSlot[OraclePriceData]]
+    perp_oracle_price_data: dict[int, DataAndSlot[OraclePriceData]]
+    spot_oracle_price_data: dict[int, DataAndSlot[OraclePriceData]]
+
+
+class CachedDriftClientAccountSubscriber(
+    DriftClientAccountSubscriber, RefreshableCache
+):
     def __init__(
         self,
         program: Program,
@@ -33,10 +56,25 @@ class CachedDriftClientAccountSubscriber(DriftClientAccountSubscriber):
         oracle_infos: list[OracleInfo],
         should_find_all_markets_and_oracles: bool = True,
         commitment: Commitment = Confirmed,
+        cache_ttl_ms: Optional[int] = None,
+        decode_workers: int = 4,
+        max_concurrency: int = 8,
+        oracle_cache: Optional[OracleCache] = None,
+        decode_pool: Optional[Executor] = None,
     ):
         self.program = program
         self.commitment = commitment
-        self.cache = None
+        # batches, throttles and chunks every fetch
+        self.account_loader = AccountLoader(
+            self.program.provider.connection, self.commitment, max_concurrency
+        )
+        # decoding runs off the event loop so it overlaps with pending fetches
+        self.decode_workers = decode_workers
+        self.decode_pool = decode_pool
+        self.owns_decode_pool = decode_pool is None
+        self.cache: Optional[DriftClientCache] = None
+        self.oracle_cache = oracle_cache
+        self.init_refresh(cache_ttl_ms)
         self.perp_market_indexes = perp_market_indexes
         self.spot_market_indexes = spot_market_indexes
         self.oracle_infos = oracle_infos
@@ -45,116 +83,208 @@ class CachedDriftClientAccountSubscriber(DriftClientAccountSubscriber):
     async def subscribe(self):
         await self.update_cache()
 
-    async def update_cache(self):
-        if self.cache is None:
-            self.cache = {}
-
-        state_and_slot = await get_state_account_and_slot(self.program)
-        self.cache["state"] = state_and_slot
+    async def _update_cache(self):
+        state_public_key = get_state_public_key(self.program.program_id)
+        state_buffer_and_slot = await self.account_loader.load(state_public_key)
+        if state_buffer_and_slot is None:
+            raise Exception(f"State account {state_public_key} not found")
 
-        oracle_data = {}
-        spot_markets = []
-        perp_markets = []
+        state_and_slot = DataAndSlot(
+            state_buffer_and_slot.slot,
+            self.program.coder.accounts.decode(state_buffer_and_slot.buffer),
+        )
 
         if self.should_find_all_markets_and_oracles:
-            for i in range(state_and_slot.data.number_of_spot_markets):
-                spot_market_and_slot = await get_spot_market_account_and_slot(
-                    self.program, i
-                )
-                spot_markets.append(spot_market_and_slot)
-
-                oracle_price_data_and_slot = await get_oracle_price_data_and_slot(
-                    self.program.provider.connection,
-                    spot_market_and_slot.data.oracle,
-                    spot_market_and_slot.data.oracle_source,
-                )
-                oracle_data[
-                    str(spot_market_and_slot.data.oracle)
-                ] = oracle_price_data_and_slot
-
-            self.cache["spot_markets"] = spot_markets
-
-            for i in range(state_and_slot.data.number_of_markets):
-                perp_market_and_slot = await get_perp_market_account_and_slot(
-                    self.program, i
-                )
-                perp_markets.append(perp_market_and_slot)
-
-                oracle_price_data_and_slot = await get_oracle_price_data_and_slot(
-                    self.program.provider.connection,
-                    perp_market_and_slot.data.amm.oracle,
-                    perp_market_and_slot.data.amm.oracle_source,
-                )
-                oracle_data[
-                    str(perp_market_and_slot.data.amm.oracle)
-                ] = oracle_price_data_and_slot
-
-            self.cache["perp_markets"] = perp_markets
-
-            self.cache["oracle_price_data"] = oracle_data
+            spot_market_indexes = list(
+                range(state_and_slot.data.number_of_spot_markets)
+            )
+            perp_market_indexes = list(range(state_and_slot.data.number_of_markets))
         else:
             # force quote spot market
             if 0 not in self.spot_market_indexes:
                 self.spot_market_indexes.insert(0, 0)
 
-            for market_index in sorted(self.spot_market_indexes):
-                spot_market_and_slot = await get_spot_market_account_and_slot(
-                    self.program, market_index
+            spot_market_indexes = sorted(self.spot_market_indexes)
+            perp_market_indexes = sorted(self.perp_market_indexes)
+
+        spot_markets, perp_markets = await asyncio.gather(
+            self._get_market_accounts_and_slots(
+                [
+                    get_spot_market_public_key(self.program.program_id, market_index)
+                    for market_index in spot_market_indexes
+                ]
+            ),
+            self._get_market_accounts_and_slots(
+                [
+                    get_perp_market_public_key(self.program.program_id, market_index)
+                    for market_index in perp_market_indexes
+                ]
+            ),
+        )
+
+        oracle_infos: dict[str, OracleInfo] = {}
+        for spot_market_and_slot in spot_markets:
+            spot_market = spot_market_and_slot.data
+            # if quote market forced, we won't have the oracle info
+            if (
+                self._should_load_oracle(spot_market.oracle)
+                or spot_market.market_index == QUOTE_SPOT_MARKET_INDEX
+            ):
+                oracle_infos[str(spot_market.oracle)] = OracleInfo(
+                    spot_market.oracle, spot_market.oracle_source
+                )
+
+        for perp_market_and_slot in perp_markets:
+            perp_market = perp_market_and_slot.data
+            if self._should_load_oracle(perp_market.amm.oracle):
+                oracle_infos[str(perp_market.amm.oracle)] = OracleInfo(
+                    perp_market.amm.oracle, perp_market.amm.oracle_source
                 )
-                spot_markets.append(spot_market_and_slot)
-
-                if (
-                    any(
-                        info.pubkey == spot_market_and_slot.data.oracle
-                        for info in self.oracle_infos
-                    )
-                    or market_index == QUOTE_SPOT_MARKET_INDEX
-                ):  # if quote market forced, we won't have the oracle info
-                    oracle_price_data_and_slot = await get_oracle_price_data_and_slot(
-                        self.program.provider.connection,
-                        spot_market_and_slot.data.oracle,
-                        spot_market_and_slot.data.oracle_source,
-                    )
-                    oracle_data[
-                        str(spot_market_and_slot.data.oracle)
-                    ] = oracle_price_data_and_slot
-
-            self.cache["spot_markets"] = spot_markets
-
-            for market_index in sorted(self.perp_market_indexes):
-                perp_market_and_slot = await get_perp_market_account_and_slot(
-                    self.program, market_index
+
+        oracle_price_data = await self._get_oracle_price_data_and_slots(
+            list(oracle_infos.values())
+        )
+
+        self.cache = DriftClientCache(
+            state=state_and_slot,
+            spot_markets=tuple(spot_markets),
+            perp_markets=tuple(perp_markets),
+            oracle_price_data=oracle_price_data,
+            perp_oracle_price_data={
+                perp_market.data.market_index: oracle_price_data[
+                    str(perp_market.data.amm.oracle)
+                ]
+                for perp_market in perp_markets
+                if str(perp_market.data.amm.oracle) in oracle_price_data
+            },
+            spot_oracle_price_data={
+                spot_market.data.market_index: oracle_price_data[
+                    str(spot_market.data.oracle)
+                ]
+                for spot_market in spot_markets
+                if str(spot_market.data.oracle) in oracle_price_data
+            },
+        )
+
+    def _should_load_oracle(self, oracle: Pubkey) -> bool:
+        return self.should_find_all_markets_and_oracles or any(
+            info.pubkey == oracle for info in self.oracle_infos
+        )
+
+    async def _get_multiple_buffers_and_slots(
+        self, pubkeys: list[Pubkey]
+    ) -> list[Optional[BufferAndSlot]]:
+        return await asyncio.gather(
+            *[self.account_loader.load(pubkey) for pubkey in pubkeys]
+        )
+
+    def _get_decode_pool(self) -> Executor:
+        if self.decode_pool is None:
+            self.decode_pool = ThreadPoolExecutor(max_workers=self.decode_workers)
+        return self.decode_pool
+
+    async def _get_market_accounts_and_slots(
+        self, pubkeys: list[Pubkey]
+    ) -> list[DataAndSlot]:
+        buffers_and_slots = await self._get_multiple_buffers_and_slots(pubkeys)
+        # markets are looked up by position, so a gap would shift every later market
+        for pubkey, buffer_and_slot in zip(pubkeys, buffers_and_slots):
+            if buffer_and_slot is None:
+                raise Exception(f"Market account {pubkey} not found")
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self._get_decode_pool(), self._decode_market_accounts, buffers_and_slots
+        )
+
+    def _decode_market_accounts(
+        self, buffers_and_slots: list[BufferAndSlot]
+    ) -> list[DataAndSlot]:
+        decode = self.program.coder.accounts.decode
+        return [
+            DataAndSlot(buffer_and_slot.slot, decode(buffer_and_slot.buffer))
+            for buffer_and_slot in buffers_and_slots
+        ]
+
+    async def _get_oracle_price_data_and_slots(
+        self, oracle_infos: list[OracleInfo]
+    ) -> dict[str, DataAndSlot[OraclePriceData]]:
+        oracle_data = {}
+
+        oracle_infos_to_fetch = []
+        for oracle_info in oracle_infos:
+            if is_variant(oracle_info.source, "QuoteAsset"):
+                oracle_data[str(oracle_info.pubkey)] = DataAndSlot(
+                    data=OraclePriceData(PRICE_PRECISION, 0, 1, 1, 0, True), slot=0
                 )
-                perp_markets.append(perp_market_and_slot)
+            else:
+                oracle_infos_to_fetch.append(oracle_info)
+
+        if self.oracle_cache is not None:
+            cached_oracle_data = await asyncio.gather(
+                *[
+                    self.oracle_cache.get(str(oracle_info.pubkey))
+                    for oracle_info in oracle_infos_to_fetch
+                ]
+            )
+            uncached_oracle_infos = []
+            for oracle_info, cached in zip(oracle_infos_to_fetch, cached_oracle_data):
+                if cached is not None:
+                    oracle_data[str(oracle_info.pubkey)] = cached
+                else:
+                    uncached_oracle_infos.append(oracle_info)
+            oracle_infos_to_fetch = uncached_oracle_infos
+
+        buffers_and_slots = await self._get_multiple_buffers_and_slots(
+            [oracle_info.pubkey for oracle_info in oracle_infos_to_fetch]
+        )
+        fetched_oracle_data = await asyncio.get_running_loop().run_in_executor(
+            self._get_decode_pool(),
+            self._decode_oracles,
+            oracle_infos_to_fetch,
+            buffers_and_slots,
+        )
+        oracle_data.update(fetched_oracle_data)
+
+        if self.oracle_cache is not None:
+            await asyncio.gather(
+                *[
+                    self.oracle_cache.set(key, value)
+                    for key, value in fetched_oracle_data.items()
+                ]
+            )
 
-                if any(
-                    info.pubkey == perp_market_and_slot.data.amm.oracle
-                    for info in self.oracle_infos
-                ):
-                    oracle_price_data_and_slot = await get_oracle_price_data_and_slot(
-                        self.program.provider.connection,
-                        perp_market_and_slot.data.amm.oracle,
-                        perp_market_and_slot.data.amm.oracle_source,
-                    )
-                    oracle_data[
-                        str(perp_market_and_slot.data.amm.oracle)
-                    ] = oracle_price_data_and_slot
+        return oracle_data
 
-            self.cache["perp_markets"] = perp_markets
+    def _decode_oracles(
+        self,
+        oracle_infos: list[OracleInfo],
+        buffers_and_slots: list[Optional[BufferAndSlot]],
+    ) -> dict[str, DataAndSlot[OraclePriceData]]:
+        oracle_data = {}
+        for oracle_info, buffer_and_slot in zip(oracle_infos, buffers_and_slots):
+            if buffer_and_slot is None:
+                continue
 
-            self.cache["oracle_price_data"] = oracle_data
+            oracle_data[str(oracle_info.pubkey)] = DataAndSlot(
+                buffer_and_slot.slot,
+                decode_oracle(buffer_and_slot.buffer, oracle_info.source),
+            )
+
+        return oracle_data
 
     async def fetch(self):
         await self.update_cache()
 
     def get_state_account_and_slot(self) -> Optional[DataAndSlot[StateAccount]]:
-        return self.cache["state"]
+        self._refresh_if_stale()
+        return self.cache.state
 
     def get_perp_market_and_slot(
         self, market_index: int
     ) -> Optional[DataAndSlot[PerpMarketAccount]]:
+        self._refresh_if_stale()
         try:
-            return self.cache["perp_markets"][market_index]
+            return self.cache.perp_markets[market_index]
         except IndexError:
             print(
                 f"WARNING: Perp market {market_index} not found in cache, Location: {stack_trace()}"
@@ -164,8 +294,9 @@ class CachedDriftClientAccountSubscriber(DriftClientAccountSubscriber):
     def get_spot_market_and_slot(
         self, market_index: int
     ) -> Optional[DataAndSlot[SpotMarketAccount]]:
+        self._refresh_if_stale()
         try:
-            return self.cache["spot_markets"][market_index]
+            return self.cache.spot_markets[market_index]
         except IndexError:
             print(
                 f"WARNING: Spot market {market_index} not found in cache Location: {stack_trace()}"
@@ -175,8 +306,9 @@ class CachedDriftClientAccountSubscriber(DriftClientAccountSubscriber):
     def get_oracle_price_data_and_slot(
         self, oracle: Pubkey
     ) -> Optional[DataAndSlot[OraclePriceData]]:
+        self._refresh_if_stale()
         try:
-            return self.cache["oracle_price_data"][str(oracle)]
+            return self.cache.oracle_price_data[str(oracle)]
         except KeyError:
             print(
                 f"WARNING: Oracle {oracle} not found in cache, Location: {stack_trace()}"
@@ -185,29 +317,43 @@ class CachedDriftClientAccountSubscriber(DriftClientAccountSubscriber):
 
     def get_oracle_price_data_and_slot_for_perp_market(
         self, market_index: int
-    ) -> Optional[OraclePriceData]:
-        perp_market = self.get_perp_market_and_slot(market_index)
-        if perp_market:
-            oracle = perp_market.data.amm.oracle
-            return self.get_oracle_price_data_and_slot(oracle)
-        return None
+    ) -> Optional[DataAndSlot[OraclePriceData]]:
+        self._refresh_if_stale()
+        try:
+            return self.cache.perp_oracle_price_data[market_index]
+        except KeyError:
+            print(
+                f"WARNING: Oracle for perp market {market_index} not found in cache, Location: {stack_trace()}"
+            )
+            return None
 
     def get_oracle_price_data_and_slot_for_spot_market(
         self, market_index: int
-    ) -> Optional[OraclePriceData]:
-        spot_market = self.get_spot_market_and_slot(market_index)
-        if spot_market:
-            oracle = spot_market.data.oracle
-            return self.get_oracle_price_data_and_slot(oracle)
-        return None
+    ) -> Optional[DataAndSlot[OraclePriceData]]:
+        self._refresh_if_stale()
+        try:
+            return self.cache.spot_oracle_price_data[market_index]
+        except KeyError:
+            print(
+                f"WARNING: Oracle for spot market {market_index} not found in cache, Location: {stack_trace()}"
+            )
+            return None
 
     async def unsubscribe(self):
+        self.cancel_update()
         self.cache = None
+        if self.owns_decode_pool and self.decode_pool is not None:
+            self.decode_pool.shutdown(wait=False)
+            self.decode_pool = None
 
-    def get_market_accounts_and_slots(self) -> list[DataAndSlot[PerpMarketAccount]]:
-        return self.cache["perp_markets"]
+    def get_market_accounts_and_slots(
+        self,
+    ) -> tuple[DataAndSlot[PerpMarketAccount], ...]:
+        self._refresh_if_stale()
+        return self.cache.perp_markets
 
     def get_spot_market_accounts_and_slots(
         self,
-    ) -> list[DataAndSlot[SpotMarketAccount]]:
-        return self.cache["spot_markets"]
+    ) -> tuple[DataAndSlot[SpotMarketAccount], ...]:
+        self._refresh_if_stale()
+        return self.cache.spot_markets
@@ -0,0 +1,37 @@
+import time
+from abc import abstractmethod
+from typing import Optional
+
+from driftpy.accounts.types import DataAndSlot
+from driftpy.types import OraclePriceData
+
+
+class OracleCache:
+    @abstractmethod
+    async def get(self, key: str) -> Optional[DataAndSlot[OraclePriceData]]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: DataAndSlot[OraclePriceData]):
+        pass
+
+
+class InMemoryOracleCache(OracleCache):
+    def __init__(self, ttl_ms: int = 1_000):
+        self.ttl_ms = ttl_ms
+        self.entries: dict[str, tuple[float, DataAndSlot[OraclePriceData]]] = {}
+
+    async def get(self, key: str) -> Optional[DataAndSlot[OraclePriceData]]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self.entries[key]
+            return None
+
+        return value
+
+    async def set(self, key: str, value: DataAndSlot[OraclePriceData]):
+        self.entries[key] = (time.monotonic() + self.ttl_ms / 1000, value)
@@ -0,0 +1,90 @@
+import asyncio
+import time
+from abc import abstractmethod
+from typing import Optional
+
+
+class RefreshableCache:
+    def init_refresh(self, cache_ttl_ms: Optional[int]):
+        self.cache_ttl_ms = cache_ttl_ms
+        self.last_updated: Optional[float] = None
+        self.invalidated = False
+        self.retry_after: Optional[float] = None
+        self.update_task: Optional[asyncio.Task] = None
+
+    @abstractmethod
+    async def _update_cache(self):
+        pass
+
+    async def update_cache(self):
+        # concurrent callers share the in flight update instead of refetching
+        if self.update_task is None or self.update_task.done():
+            self._start_update(asyncio.get_running_loop())
+
+        await asyncio.shield(self.update_task)
+
+    def is_stale(self) -> bool:
+        if self.last_updated is None:
+            return False
+
+        if self.invalidated:
+            return True
+
+        if self.cache_ttl_ms is None:
+            return False
+
+        return (time.monotonic() - self.last_updated) * 1000 >= self.cache_ttl_ms
+
+    def invalidate(self):
+        self.invalidated = True
+
+    def _refresh_if_stale(self):
+        if not self.is_stale():
+            return
+
+        if self.update_task is not None and not self.update_task.done():
+            return
+
+        if self.retry_after is not None and time.monotonic() < self.retry_after:
+            return
+
+        # getters are sync, so only refresh in the background when a loop is running
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        self._start_update(loop)
+        self.update_task.add_done_callback(self._on_refresh_done)
+
+    def _start_update(self, loop: asyncio.AbstractEventLoop):
+        self.update_task = loop.create_task(self._run_update())
+
+    async def _run_update(self):
+        # invalidations made while the update is in flight survive it
+        was_invalidated = self.invalidated
+        self.invalidated = False
+        try:
+            await self._update_cache()
+        except BaseException:
+            self.invalidated = self.invalidated or was_invalidated
+            raise
+
+        self.last_updated = time.monotonic()
+        self.retry_after = None
+
+    def _on_refresh_done(self, task: asyncio.Task):
+        if task.cancelled() or task.exception() is None:
+            return
+
+        print(f"WARNING: cache refresh failed: {task.exception()}")
+        # back off a full ttl instead of retrying on every read
+        if self.cache_ttl_ms is not None:
+            self.retry_after = time.monotonic() + self.cache_ttl_ms / 1000
+
+    def cancel_update(self):
+        if self.update_task is not None:
+            self.update_task.cancel()
+            self.update_task = None
+        self.last_updated = None
+        self.retry_after = None
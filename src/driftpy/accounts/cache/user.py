@@ -6,25 +6,28 @@ from solana.rpc.commitment import Commitment
 
 from driftpy.accounts import get_user_account_and_slot
 from driftpy.accounts import UserAccountSubscriber, DataAndSlot
+from driftpy.accounts.cache.refresh import RefreshableCache
 from driftpy.types import UserAccount
 
 
-class CachedUserAccountSubscriber(UserAccountSubscriber):
+class CachedUserAccountSubscriber(UserAccountSubscriber, RefreshableCache):
     def __init__(
         self,
         user_pubkey: Pubkey,
         program: Program,
         commitment: Commitment = "confirmed",
+        cache_ttl_ms: Optional[int] = None,
     ):
         self.program = program
         self.commitment = commitment
         self.user_pubkey = user_pubkey
         self.user_and_slot = None
+        self.init_refresh(cache_ttl_ms)
 
     async def subscribe(self):
         await self.update_cache()
 
-    async def update_cache(self):
+    async def _update_cache(self):
         user_and_slot = await get_user_account_and_slot(self.program, self.user_pubkey)
         self.user_and_slot = user_and_slot
 
@@ -37,7 +40,9 @@ class CachedUserAccountSubscriber(UserAccountSubscriber):
                 self.user_and_slot = data
 
     def get_user_account_and_slot(self) -> Optional[DataAndSlot[UserAccount]]:
+        self._refresh_if_stale()
         return self.user_and_slot
 
     def unsubscribe(self):
+        self.cancel_update()
         self.user_and_slot = None
@@ -105,8 +105,12 @@ class PollingDriftClientAccountSubscriber(DriftClientAccountSubscriber):
             )
             self.callbacks[str(pubkey)] = callback_id
 
-        for oracle_info in self.oracle_infos:
-            await self.add_oracle(oracle_info.pubkey, oracle_info.source)
+        await asyncio.gather(
+            *[
+                self.add_oracle(oracle_info.pubkey, oracle_info.source)
+                for oracle_info in self.oracle_infos
+            ]
+        )
 
     def _get_state_callback(self):
         def cb(buffer: bytes, slot: int):
@@ -6,6 +6,7 @@ from solders.pubkey import Pubkey
 from solana.rpc.commitment import Commitment
 
 from driftpy.accounts import get_account_data_and_slot
+from driftpy.accounts.account_loader import AccountLoader
 from driftpy.accounts import UserAccountSubscriber, DataAndSlot
 
 import websockets
@@ -27,6 +28,7 @@ class WebsocketAccountSubscriber(UserAccountSubscriber, Generic[T]):
         commitment: Commitment = "confirmed",
         decode: Optional[Callable[[bytes], T]] = None,
         initial_data: Optional[DataAndSlot] = None,
+        account_loader: Optional[AccountLoader] = None,
     ):
         self.program = program
         self.commitment = commitment
@@ -37,6 +39,7 @@ class WebsocketAccountSubscriber(UserAccountSubscriber, Generic[T]):
             decode if decode is not None else self.program.coder.accounts.decode
         )
         self.ws = None
+        self.account_loader = account_loader
 
     async def subscribe(self):
         if self.data_and_slot is None:
@@ -82,9 +85,17 @@ class WebsocketAccountSubscriber(UserAccountSubscriber, Generic[T]):
                 continue
 
     async def fetch(self):
-        new_data = await get_account_data_and_slot(
-            self.pubkey, self.program, self.commitment, self.decode
-        )
+        if self.account_loader is not None:
+            buffer_and_slot = await self.account_loader.load(self.pubkey)
+            new_data = (
+                DataAndSlot(buffer_and_slot.slot, self.decode(buffer_and_slot.buffer))
+                if buffer_and_slot is not None
+                else None
+            )
+        else:
+            new_data = await get_account_data_and_slot(
+                self.pubkey, self.program, self.commitment, self.decode
+            )
         self.update_data(new_data)
 
     def update_data(self, new_data: Optional[DataAndSlot[T]]):
@@ -5,6 +5,7 @@ from typing import Optional, Sequence, Union
 from anchorpy import Program
 from solana.rpc.commitment import Commitment
 
+from driftpy.accounts.account_loader import AccountLoader
 from driftpy.accounts.ws.account_subscriber import WebsocketAccountSubscriber
 from driftpy.constants.config import find_all_market_and_oracles
 from driftpy.market_map.market_map import MarketMap
@@ -35,6 +36,7 @@ class WebsocketDriftClientAccountSubscriber(DriftClientAccountSubscriber):
         full_oracle_wrappers: Sequence[FullOracleWrapper],
         should_find_all_markets_and_oracles: bool,
         commitment: Commitment = "confirmed",
+        max_concurrency: int = 8,
     ):
         self.program = program
         self.commitment = commitment
@@ -52,6 +54,9 @@ class WebsocketDriftClientAccountSubscriber(DriftClientAccountSubscriber):
         self.perp_market_map = None
         self.spot_market_oracle_map: dict[int, Pubkey] = {}
         self.perp_market_oracle_map: dict[int, Pubkey] = {}
+        self.account_loader = AccountLoader(
+            self.program.provider.connection, self.commitment, max_concurrency
+        )
 
     async def subscribe(self):
         if self.is_subscribed():
@@ -59,7 +64,10 @@ class WebsocketDriftClientAccountSubscriber(DriftClientAccountSubscriber):
 
         state_public_key = get_state_public_key(self.program.program_id)
         self.state_subscriber = WebsocketAccountSubscriber[StateAccount](
-            state_public_key, self.program, self.commitment
+            state_public_key,
+            self.program,
+            self.commitment,
+            account_loader=self.account_loader,
         )
         await self.state_subscriber.subscribe()
 
@@ -100,25 +108,43 @@ class WebsocketDriftClientAccountSubscriber(DriftClientAccountSubscriber):
             self.spot_market_map = spot_market_map
             self.perp_market_map = perp_market_map
 
-            for full_oracle_wrapper in self.full_oracle_wrappers:
-                await self.subscribe_to_oracle(full_oracle_wrapper)
+            await asyncio.gather(
+                *[
+                    self.subscribe_to_oracle(full_oracle_wrapper)
+                    for full_oracle_wrapper in self._unique_oracle_wrappers()
+                ]
+            )
 
             await spot_market_map.subscribe()
             await perp_market_map.subscribe()
 
         else:
-            for market_index in self.perp_market_indexes:
-                await self.subscribe_to_perp_market(market_index)
-
-            for market_index in self.spot_market_indexes:
-                await self.subscribe_to_spot_market(market_index)
-
-            for full_oracle_wrapper in self.full_oracle_wrappers:
-                await self.subscribe_to_oracle_info(full_oracle_wrapper)
+            # the account loader batches and throttles the initial fetches
+            await asyncio.gather(
+                *[
+                    self.subscribe_to_perp_market(market_index)
+                    for market_index in self.perp_market_indexes
+                ],
+                *[
+                    self.subscribe_to_spot_market(market_index)
+                    for market_index in self.spot_market_indexes
+                ],
+                *[
+                    self.subscribe_to_oracle_info(full_oracle_wrapper)
+                    for full_oracle_wrapper in self._unique_oracle_wrappers()
+                ],
+            )
 
         await self._set_perp_oracle_map()
         await self._set_spot_oracle_map()
 
+    def _unique_oracle_wrappers(self):
+        # concurrent subscribes can't see each other, so drop repeated oracles
+        return {
+            str(full_oracle_wrapper.pubkey): full_oracle_wrapper
+            for full_oracle_wrapper in self.full_oracle_wrappers
+        }.values()
+
     async def subscribe_to_spot_market(
         self,
         market_index: int,
@@ -135,6 +161,7 @@ class WebsocketDriftClientAccountSubscriber(DriftClientAccountSubscriber):
             self.program,
             self.commitment,
             initial_data=initial_data,
+            account_loader=self.account_loader,
         )
         await spot_market_subscriber.subscribe()
         self.spot_market_subscribers[market_index] = spot_market_subscriber
@@ -155,6 +182,7 @@ class WebsocketDriftClientAccountSubscriber(DriftClientAccountSubscriber):
             self.program,
             self.commitment,
             initial_data=initial_data,
+            account_loader=self.account_loader,
         )
         await perp_market_subscriber.subscribe()
         self.perp_market_subscribers[market_index] = perp_market_subscriber
@@ -172,6 +200,7 @@ class WebsocketDriftClientAccountSubscriber(DriftClientAccountSubscriber):
             self.commitment,
             get_oracle_decode_fn(full_oracle_wrapper.oracle_source),
             initial_data=full_oracle_wrapper.oracle_price_data_and_slot,
+            account_loader=self.account_loader,
         )
         await oracle_subscriber.subscribe()
         self.oracle_subscribers[str(full_oracle_wrapper.pubkey)] = oracle_subscriber
@@ -188,6 +217,7 @@ class WebsocketDriftClientAccountSubscriber(DriftClientAccountSubscriber):
             self.program,
             self.commitment,
             get_oracle_decode_fn(oracle_info.source),
+            account_loader=self.account_loader,
         )
 
         await oracle_subscriber.subscribe()
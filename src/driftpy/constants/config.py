@@ -222,10 +222,14 @@ def decode_account(account_data: str, program: Program) -> PerpMarketAccount:
 def find_market_config_by_index(
     market_configs: list[Union[SpotMarketConfig, PerpMarketConfig]], market_index: int
 ) -> Optional[Union[SpotMarketConfig, PerpMarketConfig]]:
-    for config in market_configs:
-        if hasattr(config, "market_index") and config.market_index == market_index:
-            return config
-    return None
+    return next(
+        (
+            config
+            for config in market_configs
+            if hasattr(config, "market_index") and config.market_index == market_index
+        ),
+        None,
+    )
 
 
 def get_markets_and_oracles(
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 from deprecated import deprecated
@@ -141,8 +142,9 @@ class DriftClient:
 
     async def subscribe(self):
         await self.account_subscriber.subscribe()
-        for sub_account_id in self.sub_account_ids:
-            await self.add_user(sub_account_id)
+        await asyncio.gather(
+            *[self.add_user(sub_account_id) for sub_account_id in self.sub_account_ids]
+        )
 
     async def add_user(self, sub_account_id: int):
         if sub_account_id in self.users:
@@ -19,7 +19,9 @@ from driftpy.math.spot_position import (
 )
 from driftpy.math.amm import calculate_market_open_bid_ask
 from driftpy.oracles.strict_oracle_price import StrictOraclePrice
-from driftpy.types import OraclePriceData
+from driftpy.types import OraclePriceData, is_exact_variant
+
+_BASE_DENOM = AMM_TO_QUOTE_PRECISION_RATIO * PRICE_PRECISION
 
 
 class DriftUser:
@@ -53,6 +55,10 @@ class DriftUser:
             self.program, self.user_public_key
         )
 
+        self.position_maps_user: Optional[UserAccount] = None
+        self.perp_position_map: dict[int, PerpPosition] = {}
+        self.spot_position_map: dict[int, SpotPosition] = {}
+
     async def subscribe(self):
         await self.account_subscriber.subscribe()
 
@@ -93,45 +99,68 @@ class DriftUser:
         return get_signed_token_amount(token_amount, spot_position.balance_type)
 
     def get_order(self, order_id: int) -> Optional[Order]:
-        for order in self.get_user_account().orders:
-            if order.order_id == order_id:
-                return order
-
-        return None
+        return next(
+            (
+                order
+                for order in self.get_user_account().orders
+                if order.order_id == order_id
+            ),
+            None,
+        )
 
     def get_order_by_user_order_id(self, user_order_id: int):
-        for order in self.get_user_account().orders:
-            if order.user_order_id == user_order_id:
-                return order
-
-        return None
+        return next(
+            (
+                order
+                for order in self.get_user_account().orders
+                if order.user_order_id == user_order_id
+            ),
+            None,
+        )
 
     def get_open_orders(
         self,
     ):
         return list(
             filter(
-                lambda order: "Open" in str(order.status),
+                lambda order: is_exact_variant(order.status, "Open"),
                 self.get_user_account().orders,
             )
         )
 
-    def get_perp_position(self, market_index: int) -> Optional[PerpPosition]:
-        for position in self.get_user_account().perp_positions:
-            if position.market_index == market_index and not is_available(position):
-                return position
+    def _update_position_maps(self):
+        user = self.get_user_account()
+        # subscribers swap in a new account object on every update
+        if user is self.position_maps_user:
+            return
+
+        self.perp_position_map = {
+            position.market_index: position
+            for position in user.perp_positions
+            if not is_available(position)
+        }
+        self.spot_position_map = {
+            position.market_index: position
+            for position in user.spot_positions
+            if not is_spot_position_available(position)
+        }
+        self.position_maps_user = user
 
-        return None
+    def get_perp_position(self, market_index: int) -> Optional[PerpPosition]:
+        self._update_position_maps()
+        return self.perp_position_map.get(market_index)
 
     def get_spot_position(self, market_index: int) -> Optional[SpotPosition]:
-        for position in self.get_user_account().spot_positions:
-            if (
-                position.market_index == market_index
-                and not is_spot_position_available(position)
-            ):
-                return position
+        self._update_position_maps()
+        return self.spot_position_map.get(market_index)
+
+    def _get_perp_positions(self, market_index: Optional[int]) -> list[PerpPosition]:
+        self._update_position_maps()
+        if market_index is None:
+            return list(self.perp_position_map.values())
 
-        return None
+        position = self.perp_position_map.get(market_index)
+        return [position] if position is not None else []
 
     def get_perp_market_liability(
         self,
@@ -141,42 +170,42 @@ class DriftUser:
         include_open_orders: bool = False,
         signed: bool = False,
     ):
-        user = self.get_user_account()
+        max_margin_ratio = self.get_user_account().max_margin_ratio
+        is_initial = margin_category == MarginCategory.INITIAL
+        get_perp_market_account = self.drift_client.get_perp_market_account
+        get_oracle_data = self.get_oracle_data_for_perp_market
 
         total_liability_value = 0
-        for position in user.perp_positions:
-            if market_index is not None and market_index != position.market_index:
-                continue
-
+        for position in self._get_perp_positions(market_index):
             if position.lp_shares > 0:
                 continue
 
-            market = self.drift_client.get_perp_market_account(position.market_index)
+            market = get_perp_market_account(position.market_index)
 
-            price = (self.get_oracle_data_for_perp_market(position.market_index)).price
+            price = get_oracle_data(position.market_index).price
             base_asset_amount = (
                 calculate_worst_case_base_asset_amount(position)
                 if include_open_orders
                 else position.base_asset_amount
             )
-            base_value = (
-                ((base_asset_amount) if signed else abs(base_asset_amount))
-                * price
-                / (AMM_TO_QUOTE_PRECISION_RATIO * PRICE_PRECISION)
-            )
+            # divide the magnitude so short exposure truncates toward zero
+            base_value = abs(base_asset_amount) * price // _BASE_DENOM
 
             if margin_category is not None:
                 margin_ratio = calculate_market_margin_ratio(
                     market, abs(base_asset_amount), margin_category
                 )
 
-                if margin_category == MarginCategory.INITIAL:
-                    margin_ratio = max(margin_ratio, user.max_margin_ratio)
+                if is_initial:
+                    margin_ratio = max(margin_ratio, max_margin_ratio)
 
                 if liquidation_buffer is not None:
                     margin_ratio += liquidation_buffer
 
-                base_value = base_value * margin_ratio / MARGIN_PRECISION
+                base_value = base_value * margin_ratio // MARGIN_PRECISION
+
+            if signed and base_asset_amount < 0:
+                base_value = -base_value
 
             total_liability_value += base_value
         return total_liability_value
@@ -190,7 +219,6 @@ class DriftUser:
     def can_be_liquidated(self) -> bool:
         total_collateral = self.get_total_collateral()
 
-        user = self.get_user_account()
         liquidation_buffer = None
         if self.is_being_liquidated():
             liquidation_buffer = (
@@ -369,38 +397,13 @@ class DriftUser:
         self,
         market_index: int,
     ) -> Optional[SpotPosition]:
-        user = self.get_user_account()
-
-        found = False
-        for position in user.spot_positions:
-            if (
-                position.market_index == market_index
-                and not is_spot_position_available(position)
-            ):
-                found = True
-                break
-
-        if not found:
-            return None
-
-        return position
+        return self.get_spot_position(market_index)
 
     def get_user_position(
         self,
         market_index: int,
     ) -> Optional[PerpPosition]:
-        user = self.get_user_account()
-
-        found = False
-        for position in user.perp_positions:
-            if position.market_index == market_index and not is_available(position):
-                found = True
-                break
-
-        if not found:
-            return None
-
-        return position
+        return self.get_perp_position(market_index)
 
     def get_health(self) -> int:
         if self.is_being_liquidated():
@@ -425,25 +428,20 @@ class DriftUser:
         with_weight_margin_category: Optional[MarginCategory] = None,
         strict: bool = False,
     ):
-        user = self.get_user_account()
         quote_spot_market = self.drift_client.get_spot_market_account(
             QUOTE_SPOT_MARKET_INDEX
         )
+        quote_oracle_price_data = self.get_oracle_data_for_spot_market(
+            quote_spot_market.market_index
+        )
+        get_perp_market_account = self.drift_client.get_perp_market_account
+        get_oracle_data = self.get_oracle_data_for_perp_market
 
         unrealized_pnl = 0
-        for position in user.perp_positions:
-            if market_index is not None and position.market_index != market_index:
-                continue
+        for position in self._get_perp_positions(market_index):
+            market = get_perp_market_account(position.market_index)
 
-            market = self.drift_client.get_perp_market_account(position.market_index)
-
-            oracle_price_data = self.get_oracle_data_for_perp_market(
-                market.market_index
-            )
-
-            quote_oracle_price_data = self.get_oracle_data_for_spot_market(
-                quote_spot_market.market_index
-            )
+            oracle_price_data = get_oracle_data(market.market_index)
 
             if position.lp_shares > 0:
                 position = self.get_perp_position_with_lp_settle(
@@ -490,13 +488,8 @@ class DriftUser:
         self,
         market_index: int = None,
     ):
-        user = self.get_user_account()
-
         unrealized_pnl = 0
-        for position in user.perp_positions:
-            if market_index is not None and position.market_index != market_index:
-                continue
-
+        for position in self._get_perp_positions(market_index):
             perp_market = self.drift_client.get_perp_market_account(
                 position.market_index
             )
@@ -515,10 +508,15 @@ class DriftUser:
         now: Optional[int] = None,
     ) -> (int, int):
         now = now or int(time.time())
+        user = self.get_user_account()
+        max_margin_ratio = user.max_margin_ratio
+        get_spot_market_account = self.drift_client.get_spot_market_account
+        get_oracle_data = self.get_oracle_data_for_spot_market
+
         net_quote_value = 0
         total_asset_value = 0
         total_liability_value = 0
-        for spot_position in self.get_user_account().spot_positions:
+        for spot_position in user.spot_positions:
             count_for_base = (
                 market_index is None or market_index == spot_position.market_index
             )
@@ -533,12 +531,8 @@ class DriftUser:
             ):
                 continue
 
-            spot_market_account = self.drift_client.get_spot_market_account(
-                spot_position.market_index
-            )
-            oracle_price_data = self.get_oracle_data_for_spot_market(
-                spot_position.market_index
-            )
+            spot_market_account = get_spot_market_account(spot_position.market_index)
+            oracle_price_data = get_oracle_data(spot_position.market_index)
 
             twap_5m = None
             if strict:
@@ -551,6 +545,8 @@ class DriftUser:
 
             strict_oracle_price = StrictOraclePrice(oracle_price_data.price, twap_5m)
 
+            is_borrow = is_exact_variant(spot_position.balance_type, "Borrow")
+
             if (
                 spot_position.market_index == QUOTE_SPOT_MARKET_INDEX
                 and count_for_quote
@@ -563,7 +559,7 @@ class DriftUser:
                     ),
                     spot_position.balance_type,
                 )
-                if is_variant(spot_position.balance_type, "Borrow"):
+                if is_borrow:
                     weighted_token_value = abs(
                         self.get_spot_liability_value(
                             token_amount,
@@ -585,7 +581,7 @@ class DriftUser:
                 continue
 
             if not include_open_orders and count_for_base:
-                if is_variant(spot_position.balance_type, "Borrow"):
+                if is_borrow:
                     token_amount = get_signed_token_amount(
                         get_token_amount(
                             spot_position.scaled_balance,
@@ -624,7 +620,7 @@ class DriftUser:
                 spot_market_account,
                 strict_oracle_price,
                 margin_category,
-                self.get_user_account().max_margin_ratio,
+                max_margin_ratio,
             )
             worst_case_token_amount = order_fill_simulation.token_amount
             worst_case_quote_token_amount = order_fill_simulation.orders_value
@@ -656,7 +652,7 @@ class DriftUser:
             if worst_case_quote_token_amount < 0 and count_for_quote:
                 weight = SPOT_MARKET_WEIGHT_PRECISION
                 if margin_category == MarginCategory.INITIAL:
-                    weight = max(weight, self.get_user_account().max_margin_ratio)
+                    weight = max(weight, max_margin_ratio)
                 weighted_token_value = (
                     abs(worst_case_quote_token_amount)
                     * weight
@@ -1004,11 +1000,14 @@ class DriftUser:
 
         oracle = market.amm.oracle
 
-        sister_market = None
-        for market in self.drift_client.get_spot_market_accounts():
-            if market.oracle == oracle:
-                sister_market = market
-                break
+        sister_market = next(
+            (
+                spot_market
+                for spot_market in self.drift_client.get_spot_market_accounts()
+                if spot_market.oracle == oracle
+            ),
+            None,
+        )
 
         if sister_market:
             spot_position = self.get_spot_position(sister_market.market_index)
@@ -1070,26 +1069,25 @@ class DriftUser:
         if abs(token_amount_qp) == 0:
             return None
 
-        match str(position.balance_type):
-            case "SpotBalanceType.Borrow()":
-                liq_price_delta = (
-                    delta_liq
-                    * PRICE_PRECISION
-                    * SPOT_WEIGHT_PRECISION
-                    / token_amount_qp
-                    / spot_market.maintenance_liability_weight
-                )
-            case "SpotBalanceType.Deposit()":
-                liq_price_delta = (
-                    delta_liq
-                    * PRICE_PRECISION
-                    * SPOT_WEIGHT_PRECISION
-                    / token_amount_qp
-                    / spot_market.maintenance_asset_weight
-                    * -1
-                )
-            case _:
-                raise Exception(f"Invalid balance type: {position.balance_type}")
+        if is_exact_variant(position.balance_type, "Borrow"):
+            liq_price_delta = (
+                delta_liq
+                * PRICE_PRECISION
+                * SPOT_WEIGHT_PRECISION
+                / token_amount_qp
+                / spot_market.maintenance_liability_weight
+            )
+        elif is_exact_variant(position.balance_type, "Deposit"):
+            liq_price_delta = (
+                delta_liq
+                * PRICE_PRECISION
+                * SPOT_WEIGHT_PRECISION
+                / token_amount_qp
+                / spot_market.maintenance_asset_weight
+                * -1
+            )
+        else:
+            raise Exception(f"Invalid balance type: {position.balance_type}")
 
         price = self.get_oracle_data_for_spot_market(spot_market.market_index).price
         liq_price = price + liq_price_delta
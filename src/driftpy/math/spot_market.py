@@ -2,11 +2,11 @@ from typing import Union
 
 from driftpy.accounts import *
 from driftpy.math.utils import div_ceil
-from driftpy.types import OraclePriceData
+from driftpy.types import OraclePriceData, is_exact_variant
 
 
 def get_signed_token_amount(amount, balance_type):
-    return amount if is_variant(balance_type, "Deposit") else -abs(amount)
+    return amount if is_exact_variant(balance_type, "Deposit") else -abs(amount)
 
 
 def get_token_amount(
@@ -14,7 +14,7 @@ def get_token_amount(
 ) -> int:
     precision_decrease = 10 ** (19 - spot_market.decimals)
 
-    if is_variant(balance_type, "Deposit"):
+    if is_exact_variant(balance_type, "Deposit"):
         return int(
             (balance * spot_market.cumulative_deposit_interest) / precision_decrease
         )
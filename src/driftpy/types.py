@@ -13,6 +13,12 @@ def is_variant(enum, type: str) -> bool:
     return type in str(enum)
 
 
+def is_exact_variant(enum, type: str) -> bool:
+    # compares the variant class name instead of formatting the enum, works for
+    # both driftpy.types enums and the ones anchorpy builds when decoding
+    return enum.__class__.__name__ == type
+
+
 def is_one_of_variant(enum, types):
     return any(type in str(enum) for type in types)
 
@@ -0,0 +1,450 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from pytest import mark, raises
+from solders.pubkey import Pubkey
+
+from driftpy.accounts.account_loader import AccountLoader
+from driftpy.accounts.cache import (
+    CachedDriftClientAccountSubscriber,
+    CachedUserAccountSubscriber,
+    InMemoryOracleCache,
+)
+from driftpy.accounts.types import DataAndSlot
+from driftpy.addresses import (
+    get_perp_market_public_key,
+    get_spot_market_public_key,
+    get_state_public_key,
+)
+from driftpy.types import OracleSource
+
+PROGRAM_ID = Pubkey.new_unique()
+
+
+class FakeConnection:
+    def __init__(self, accounts: dict):
+        self.accounts = accounts
+        self.error = None
+        self.get_account_info_calls = 0
+        self.get_multiple_accounts_calls = []
+
+    def response(self, value):
+        return SimpleNamespace(context=SimpleNamespace(slot=1), value=value)
+
+    def account(self, pubkey):
+        data = self.accounts.get(str(pubkey))
+        return None if data is None else SimpleNamespace(data=data)
+
+    async def get_account_info(self, pubkey, encoding=None, commitment=None):
+        self.get_account_info_calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.response(self.account(pubkey))
+
+    async def get_multiple_accounts(self, pubkeys, commitment=None, encoding=None):
+        self.get_multiple_accounts_calls.append(list(pubkeys))
+        if self.error is not None:
+            raise self.error
+        return self.response([self.account(pubkey) for pubkey in pubkeys])
+
+
+def make_program(connection: FakeConnection):
+    # accounts are stored already decoded
+    return SimpleNamespace(
+        program_id=PROGRAM_ID,
+        provider=SimpleNamespace(connection=connection),
+        coder=SimpleNamespace(accounts=SimpleNamespace(decode=lambda data: data)),
+    )
+
+
+def make_accounts(number_of_spot_markets: int = 3, number_of_perp_markets: int = 2):
+    accounts = {
+        str(get_state_public_key(PROGRAM_ID)): SimpleNamespace(
+            number_of_spot_markets=number_of_spot_markets,
+            number_of_markets=number_of_perp_markets,
+        )
+    }
+    for market_index in range(number_of_spot_markets):
+        accounts[
+            str(get_spot_market_public_key(PROGRAM_ID, market_index))
+        ] = SimpleNamespace(
+            market_index=market_index,
+            oracle=Pubkey.new_unique(),
+            oracle_source=OracleSource.QuoteAsset(),
+        )
+    for market_index in range(number_of_perp_markets):
+        accounts[
+            str(get_perp_market_public_key(PROGRAM_ID, market_index))
+        ] = SimpleNamespace(
+            market_index=market_index,
+            amm=SimpleNamespace(
+                oracle=Pubkey.new_unique(),
+                oracle_source=OracleSource.QuoteAsset(),
+            ),
+        )
+    return accounts
+
+
+def make_cached_subscriber(connection: FakeConnection, **kwargs):
+    return CachedDriftClientAccountSubscriber(
+        make_program(connection), [], [], [], True, **kwargs
+    )
+
+
+@mark.asyncio
+async def test_cached_subscriber_loads_markets_by_index():
+    connection = FakeConnection(make_accounts())
+    subscriber = make_cached_subscriber(connection)
+    await subscriber.subscribe()
+
+    for market_index in range(3):
+        spot_market = subscriber.get_spot_market_and_slot(market_index)
+        assert spot_market.data.market_index == market_index
+    for market_index in range(2):
+        perp_market = subscriber.get_perp_market_and_slot(market_index)
+        assert perp_market.data.market_index == market_index
+
+    await subscriber.unsubscribe()
+
+
+@mark.asyncio
+async def test_cached_subscriber_batches_market_fetches():
+    connection = FakeConnection(make_accounts())
+    subscriber = make_cached_subscriber(connection)
+    await subscriber.subscribe()
+
+    # state, then every spot and perp market in one request
+    assert len(connection.get_multiple_accounts_calls) == 2
+    assert len(connection.get_multiple_accounts_calls[1]) == 5
+    assert connection.get_account_info_calls == 0
+
+    await subscriber.unsubscribe()
+
+
+@mark.asyncio
+async def test_cached_subscriber_missing_market_raises():
+    accounts = make_accounts()
+    del accounts[str(get_spot_market_public_key(PROGRAM_ID, 1))]
+    subscriber = make_cached_subscriber(FakeConnection(accounts))
+
+    with raises(Exception, match="not found"):
+        await subscriber.subscribe()
+
+    await subscriber.unsubscribe()
+
+
+def state_fetches(connection: FakeConnection) -> int:
+    state_public_key = get_state_public_key(PROGRAM_ID)
+    return sum(
+        state_public_key in pubkeys
+        for pubkeys in connection.get_multiple_accounts_calls
+    )
+
+
+async def wait_for_refresh(subscriber):
+    await asyncio.gather(subscriber.update_task, return_exceptions=True)
+    # let the done callback run
+    await asyncio.sleep(0)
+
+
+@mark.asyncio
+async def test_cached_subscriber_refreshes_after_ttl():
+    connection = FakeConnection(make_accounts())
+    subscriber = make_cached_subscriber(connection, cache_ttl_ms=60_000)
+    await subscriber.subscribe()
+    assert state_fetches(connection) == 1
+
+    subscriber.get_state_account_and_slot()
+    assert not subscriber.is_stale()
+    assert state_fetches(connection) == 1
+
+    subscriber.last_updated -= 61
+    assert subscriber.is_stale()
+    for _ in range(5):
+        subscriber.get_state_account_and_slot()
+    await wait_for_refresh(subscriber)
+
+    assert state_fetches(connection) == 2
+    assert not subscriber.is_stale()
+
+    await subscriber.unsubscribe()
+
+
+@mark.asyncio
+async def test_cached_subscriber_invalidate():
+    connection = FakeConnection(make_accounts())
+    subscriber = make_cached_subscriber(connection)
+    await subscriber.subscribe()
+
+    subscriber.invalidate()
+    assert subscriber.is_stale()
+    subscriber.get_perp_market_and_slot(0)
+    subscriber.get_spot_market_and_slot(0)
+    await wait_for_refresh(subscriber)
+
+    assert state_fetches(connection) == 2
+    assert not subscriber.is_stale()
+
+    await subscriber.unsubscribe()
+
+
+@mark.asyncio
+async def test_cached_subscriber_failed_refresh_backs_off():
+    connection = FakeConnection(make_accounts())
+    subscriber = make_cached_subscriber(connection, cache_ttl_ms=60_000)
+    await subscriber.subscribe()
+
+    connection.error = Exception("429 Too Many Requests")
+    subscriber.last_updated -= 61
+    subscriber.get_state_account_and_slot()
+    await wait_for_refresh(subscriber)
+
+    for _ in range(5):
+        assert subscriber.get_state_account_and_slot() is not None
+    await asyncio.sleep(0)
+
+    # still stale, but reads wait out the backoff instead of refetching
+    assert state_fetches(connection) == 2
+    assert subscriber.is_stale()
+
+    connection.error = None
+    subscriber.retry_after -= 61
+    subscriber.get_state_account_and_slot()
+    await wait_for_refresh(subscriber)
+
+    assert state_fetches(connection) == 3
+    assert not subscriber.is_stale()
+
+    await subscriber.unsubscribe()
+
+
+@mark.asyncio
+async def test_cached_subscriber_failed_refresh_keeps_invalidation():
+    connection = FakeConnection(make_accounts())
+    subscriber = make_cached_subscriber(connection)
+    await subscriber.subscribe()
+
+    connection.error = Exception("429 Too Many Requests")
+    subscriber.invalidate()
+    subscriber.get_state_account_and_slot()
+    await wait_for_refresh(subscriber)
+
+    assert subscriber.is_stale()
+    assert state_fetches(connection) == 2
+
+    connection.error = None
+    subscriber.get_state_account_and_slot()
+    await wait_for_refresh(subscriber)
+
+    assert state_fetches(connection) == 3
+    assert not subscriber.is_stale()
+
+    await subscriber.unsubscribe()
+
+
+@mark.asyncio
+async def test_cached_subscriber_failed_fetch_does_not_look_fresh():
+    connection = FakeConnection(make_accounts())
+    subscriber = make_cached_subscriber(connection, cache_ttl_ms=60_000)
+    await subscriber.subscribe()
+
+    subscriber.last_updated -= 61
+    connection.error = Exception("429 Too Many Requests")
+    with raises(Exception, match="429"):
+        await subscriber.fetch()
+
+    assert subscriber.is_stale()
+    assert subscriber.retry_after is None
+
+    await subscriber.unsubscribe()
+
+
+def test_cached_subscriber_stale_read_without_loop():
+    connection = FakeConnection(make_accounts())
+    subscriber = make_cached_subscriber(connection, cache_ttl_ms=60_000)
+    asyncio.run(subscriber.subscribe())
+
+    subscriber.last_updated -= 61
+    assert subscriber.get_state_account_and_slot() is not None
+    assert state_fetches(connection) == 1
+
+
+@mark.asyncio
+async def test_cached_user_subscriber_refresh():
+    user_pubkey = Pubkey.new_unique()
+    connection = FakeConnection({str(user_pubkey): SimpleNamespace(authority=None)})
+    subscriber = CachedUserAccountSubscriber(
+        user_pubkey, make_program(connection), cache_ttl_ms=60_000
+    )
+    await subscriber.subscribe()
+    assert connection.get_account_info_calls == 1
+
+    subscriber.last_updated -= 61
+    for _ in range(5):
+        subscriber.get_user_account_and_slot()
+    await wait_for_refresh(subscriber)
+    assert connection.get_account_info_calls == 2
+
+    subscriber.invalidate()
+    connection.error = Exception("429 Too Many Requests")
+    subscriber.get_user_account_and_slot()
+    await wait_for_refresh(subscriber)
+
+    for _ in range(5):
+        assert subscriber.get_user_account_and_slot() is not None
+    await asyncio.sleep(0)
+    assert connection.get_account_info_calls == 3
+    assert subscriber.invalidated
+
+    connection.error = None
+    subscriber.retry_after -= 61
+    subscriber.get_user_account_and_slot()
+    await wait_for_refresh(subscriber)
+    assert connection.get_account_info_calls == 4
+    assert not subscriber.is_stale()
+
+    subscriber.unsubscribe()
+
+
+@mark.asyncio
+async def test_cached_user_subscriber_invalidation_survives_failure():
+    user_pubkey = Pubkey.new_unique()
+    connection = FakeConnection({str(user_pubkey): SimpleNamespace(authority=None)})
+    subscriber = CachedUserAccountSubscriber(user_pubkey, make_program(connection))
+    await subscriber.subscribe()
+
+    connection.error = Exception("429 Too Many Requests")
+    subscriber.invalidate()
+    subscriber.get_user_account_and_slot()
+    await wait_for_refresh(subscriber)
+    assert subscriber.is_stale()
+
+    connection.error = None
+    subscriber.get_user_account_and_slot()
+    await wait_for_refresh(subscriber)
+    assert connection.get_account_info_calls == 3
+    assert not subscriber.is_stale()
+
+    subscriber.unsubscribe()
+
+
+@mark.asyncio
+async def test_account_loader_batches_per_tick():
+    pubkeys = [Pubkey.new_unique() for _ in range(30)]
+    connection = FakeConnection(
+        {str(pubkey): bytes([i]) for i, pubkey in enumerate(pubkeys)}
+    )
+    missing = Pubkey.new_unique()
+    loader = AccountLoader(connection)
+
+    results = await asyncio.gather(
+        *[loader.load(pubkey) for pubkey in pubkeys],
+        loader.load(pubkeys[0]),
+        loader.load(missing),
+    )
+
+    assert len(connection.get_multiple_accounts_calls) == 1
+    assert len(connection.get_multiple_accounts_calls[0]) == 31
+    assert [result.buffer for result in results[:30]] == [bytes([i]) for i in range(30)]
+    assert results[30].buffer == bytes([0])
+    assert results[31] is None
+
+    await loader.load(pubkeys[1])
+    assert len(connection.get_multiple_accounts_calls) == 2
+
+    await asyncio.gather(*loader.load_tasks)
+    assert not loader.load_tasks
+
+
+@mark.asyncio
+async def test_account_loader_errors_reach_every_waiter():
+    pubkey = Pubkey.new_unique()
+    connection = FakeConnection({})
+    connection.error = Exception("rpc down")
+    loader = AccountLoader(connection)
+
+    results = await asyncio.gather(
+        loader.load(pubkey),
+        loader.load(pubkey),
+        loader.load(Pubkey.new_unique()),
+        return_exceptions=True,
+    )
+
+    assert len(connection.get_multiple_accounts_calls) == 1
+    assert all(str(result) == "rpc down" for result in results)
+
+
+@mark.asyncio
+async def test_cached_subscriber_decode_pool_lifecycle():
+    connection = FakeConnection(make_accounts())
+    subscriber = make_cached_subscriber(connection)
+    await subscriber.subscribe()
+    decode_pool = subscriber.decode_pool
+
+    await subscriber.unsubscribe()
+    assert subscriber.decode_pool is None
+    assert decode_pool._shutdown
+
+    # resubscribing starts a fresh pool
+    await subscriber.subscribe()
+    assert subscriber.get_spot_market_and_slot(0) is not None
+    await subscriber.unsubscribe()
+
+    shared_pool = ThreadPoolExecutor(max_workers=1)
+    subscriber = make_cached_subscriber(connection, decode_pool=shared_pool)
+    await subscriber.subscribe()
+    await subscriber.unsubscribe()
+    assert subscriber.decode_pool is shared_pool
+    assert not shared_pool._shutdown
+    shared_pool.shutdown()
+
+
+@mark.asyncio
+async def test_in_memory_oracle_cache_ttl():
+    value = DataAndSlot(1, "price")
+
+    oracle_cache = InMemoryOracleCache(ttl_ms=60_000)
+    assert await oracle_cache.get("oracle") is None
+    await oracle_cache.set("oracle", value)
+    assert await oracle_cache.get("oracle") is value
+
+    expired_oracle_cache = InMemoryOracleCache(ttl_ms=0)
+    await expired_oracle_cache.set("oracle", value)
+    assert await expired_oracle_cache.get("oracle") is None
+    assert "oracle" not in expired_oracle_cache.entries
+
+
+@mark.asyncio
+async def test_cached_subscriber_fetches_only_oracle_cache_misses(monkeypatch):
+    monkeypatch.setattr(
+        "driftpy.accounts.cache.drift_client.decode_oracle",
+        lambda buffer, source: buffer,
+    )
+    accounts = make_accounts()
+    spot_market = accounts[str(get_spot_market_public_key(PROGRAM_ID, 1))]
+    spot_market.oracle_source = OracleSource.Pyth()
+    accounts[str(spot_market.oracle)] = "spot price"
+    perp_market = accounts[str(get_perp_market_public_key(PROGRAM_ID, 0))]
+    perp_market.amm.oracle_source = OracleSource.Pyth()
+    accounts[str(perp_market.amm.oracle)] = "perp price"
+
+    oracle_cache = InMemoryOracleCache(ttl_ms=60_000)
+    await oracle_cache.set(str(perp_market.amm.oracle), DataAndSlot(0, "cached price"))
+
+    connection = FakeConnection(accounts)
+    subscriber = make_cached_subscriber(connection, oracle_cache=oracle_cache)
+    await subscriber.subscribe()
+
+    assert connection.get_multiple_accounts_calls[-1] == [spot_market.oracle]
+    perp_oracle = subscriber.get_oracle_price_data_and_slot_for_perp_market(0)
+    assert perp_oracle.data == "cached price"
+    spot_oracle = await oracle_cache.get(str(spot_market.oracle))
+    assert spot_oracle.data == "spot price"
+    assert subscriber.get_oracle_price_data_and_slot_for_spot_market(1) is spot_oracle
+
+    # warm refresh serves every oracle from the cache
+    await subscriber.update_cache()
+    assert len(connection.get_multiple_accounts_calls) == 5
+
+    await subscriber.unsubscribe()
@@ -314,3 +314,120 @@ async def test_sol_perp_custom_mrgn_ratio():
     m_lev_2 = user_2.get_max_leverage_for_perp(0, MarginCategory.MAINTENANCE)
     assert i_lev_2 == 2_000
     assert m_lev_2 == 10_000
+
+
+@mark.asyncio
+async def test_position_lookups():
+    user_account = deepcopy(mock_user_account)
+
+    user_account.perp_positions[3].market_index = 2
+    user_account.perp_positions[3].base_asset_amount = 5 * BASE_PRECISION
+    user_account.spot_positions[2].market_index = 1
+    user_account.spot_positions[2].scaled_balance = 10 * SPOT_BALANCE_PRECISION
+
+    user = await make_mock_user(
+        mock_perp_markets,
+        mock_spot_markets,
+        user_account,
+        [1, 1, 1, 1, 1, 1, 1, 1],
+        [1, 1, 1, 1, 1, 1, 1, 1],
+    )
+
+    assert user.get_perp_position(2) is user_account.perp_positions[3]
+    assert user.get_user_position(2) is user_account.perp_positions[3]
+    assert user.get_perp_position(0) is None
+    assert user.get_spot_position(1) is user_account.spot_positions[2]
+    assert user.get_user_spot_position(1) is user_account.spot_positions[2]
+    assert user.get_spot_position(0) is None
+
+    # a new account object from the subscriber rebuilds the lookups
+    new_user_account = deepcopy(user_account)
+    new_user_account.perp_positions[3].base_asset_amount = 0
+    user.get_user_account = lambda: new_user_account
+
+    assert user.get_perp_position(2) is None
+    assert user.get_spot_position(1) is new_user_account.spot_positions[2]
+
+
+@mark.asyncio
+async def test_margin_requirement_components():
+    perp_markets = deepcopy(mock_perp_markets)
+    spot_markets = deepcopy(mock_spot_markets)
+    user_account = deepcopy(mock_user_account)
+
+    user_account.perp_positions[0].base_asset_amount = 20 * BASE_PRECISION
+    user_account.perp_positions[0].quote_asset_amount = -10 * QUOTE_PRECISION
+    user_account.spot_positions[1].market_index = 1
+    user_account.spot_positions[1].balance_type = SpotBalanceType.Borrow()
+    user_account.spot_positions[1].scaled_balance = 1 * SPOT_BALANCE_PRECISION
+
+    user = await make_mock_user(
+        perp_markets,
+        spot_markets,
+        user_account,
+        [1, 1, 1, 1, 1, 1, 1, 1],
+        [1, 1, 1, 1, 1, 1, 1, 1],
+    )
+
+    for margin_category in [MarginCategory.INITIAL, MarginCategory.MAINTENANCE]:
+        perp_value = user.get_total_perp_position_value(margin_category, 0, True)
+        spot_liability = user.get_spot_market_liability_value(
+            None, margin_category, 0, True
+        )
+
+        assert perp_value > 0
+        assert spot_liability > 0
+        assert (
+            user.get_margin_requirement(margin_category, 0)
+            == perp_value + spot_liability
+        )
+
+
+@mark.asyncio
+async def test_leverage_components():
+    perp_markets = deepcopy(mock_perp_markets)
+    spot_markets = deepcopy(mock_spot_markets)
+    user_account = deepcopy(mock_user_account)
+
+    user_account.spot_positions[0].scaled_balance = 10_000 * SPOT_BALANCE_PRECISION
+    user_account.perp_positions[0].base_asset_amount = 20 * BASE_PRECISION
+    user_account.perp_positions[0].quote_asset_amount = -10 * QUOTE_PRECISION
+    user_account.perp_positions[1].market_index = 1
+    user_account.perp_positions[1].base_asset_amount = -5 * BASE_PRECISION
+    user_account.perp_positions[1].quote_asset_amount = 30 * QUOTE_PRECISION
+
+    user = await make_mock_user(
+        perp_markets,
+        spot_markets,
+        user_account,
+        [1, 1, 1, 1, 1, 1, 1, 1],
+        [1, 1, 1, 1, 1, 1, 1, 1],
+    )
+
+    perp_liability = user.get_perp_market_liability(include_open_orders=True)
+    perp_pnl = user.get_unrealized_pnl(True)
+    spot_asset, spot_liability = user.get_spot_market_asset_and_liability_value()
+
+    leverage = user.get_leverage()
+    assert leverage > 0
+    assert leverage == (spot_liability + perp_liability) * 10_000 // (
+        spot_asset + perp_pnl - spot_liability
+    )
+
+
+@mark.asyncio
+async def test_signed_perp_liability_truncates():
+    user_account = deepcopy(mock_user_account)
+    user_account.perp_positions[0].base_asset_amount = -(3 * BASE_PRECISION + 1)
+
+    user = await make_mock_user(
+        mock_perp_markets,
+        mock_spot_markets,
+        user_account,
+        [1, 1, 1, 1, 1, 1, 1, 1],
+        [1, 1, 1, 1, 1, 1, 1, 1],
+    )
+
+    liability = user.get_perp_market_liability(0)
+    assert liability == 3 * QUOTE_PRECISION
+    assert user.get_perp_market_liability(0, signed=True) == -liability